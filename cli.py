@@ -1,40 +1,57 @@
 import click
 import json
 import logging
-from main import SunoMusicBot
+from main import UdioMusicBot, INPUT_MODES
 from prompt_generator import PromptGenerator
-from cloud_storage import CloudStorageManager
+
+def create_and_share(bot, prompt):
+    likes = bot.create_song(prompt)
+    if likes is False:
+        click.echo(f"Create song failed for prompt: {prompt}", err=True)
+        return
+    click.echo(f"Song link: {bot.get_latest_song_sharable_link(likes)}")
 
 @click.group()
 def cli():
-    """Suno Music Bot CLI - Generate AI music with ease"""
+    """Udio Music Bot CLI - Generate AI music with ease"""
     pass
 
 @cli.command()
 @click.option('--prompt', '-p', help='Custom prompt for music generation')
-@click.option('--variations', '-v', default=1, help='Number of variations to generate')
-@click.option('--template', '-t', default='crypto_meme', help='Template to use for generation')
-def generate(prompt, variations, template):
+@click.option('--variations', '-v', default=1, type=click.IntRange(min=0), help='Number of variations to generate (0 for every combination)')
+@click.option('--template', '-t', default='synthwave', help='Template to use for generation')
+@click.option('--mode', '-m', default='coverage', type=click.Choice(PromptGenerator.SAMPLING_MODES), help='How to pick combinations from the template')
+@click.option('--seed', type=int, default=None, help='Random seed for sampled modes')
+@click.option('--input-mode', type=click.Choice(INPUT_MODES), default=None, help='How prompts are entered (defaults to human for stealth sessions)')
+def generate(prompt, variations, template, mode, seed, input_mode):
     """Generate music with a custom prompt, template, or auto-generated prompts"""
     bot = None
     try:
-        bot = SunoMusicBot()
+        if not prompt:
+            # Resolve the template before starting the browser so bad options fail fast
+            prompt_gen = PromptGenerator(seed=seed)
+            total = prompt_gen.get_template(template).size
+            count = min(variations, total) if variations else total
+            if count >= total:
+                mode = 'all'
+
+        bot = UdioMusicBot(input_mode=input_mode)
         bot.login()
         
         if prompt:
             click.echo(f"Generating music with custom prompt: {prompt}")
-            bot.generate_music(prompt)
+            create_and_share(bot, prompt)
         else:
-            prompt_gen = PromptGenerator()
-            prompts = prompt_gen.get_prompt_variations(num_variations=variations, template_name=template)
-            click.echo(f"Generating {variations} music variations using template: {template}")
+            # Prompts are streamed, so large sweeps never build the full product
+            prompts = prompt_gen.get_prompt_variations(num_variations=count, template_name=template, mode=mode)
+            click.echo(f"Generating {count} of {total} music variations using template: {template} ({mode})")
             
-            with click.progressbar(prompts) as bar:
+            with click.progressbar(prompts, length=count) as bar:
                 for prompt in bar:
                     click.echo(f"\nUsing prompt: {prompt}")
-                    bot.generate_music(prompt)
+                    create_and_share(bot, prompt)
         
-        click.echo("Music generation completed! Check the downloads folder.")
+        click.echo("Music generation completed!")
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
     finally:
@@ -2,6 +2,8 @@ import os
 import time
 import logging
 import traceback
+import math
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, List, Union
 import undetected_chromedriver
@@ -22,10 +24,12 @@ import random
 import argparse
 
 
+INPUT_MODES = ("instant", "human")
+
 parser = argparse.ArgumentParser()
 
 parser.add_argument('--headless', type=bool)
-args = parser.parse_args()
+parser.add_argument('--input-mode', choices=INPUT_MODES, default=None)
 
 
 
@@ -52,6 +56,48 @@ download_dir = os.getcwd() + "/song_downloads/"
 def count_files_in_directory(directory):
     return sum(1 for entry in os.listdir(directory) if os.path.isfile(os.path.join(directory, entry)))
 
+@contextmanager
+def phase_timer(phase):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        logger.info(f"Phase '{phase}' took {(time.perf_counter() - start) * 1000:.1f} ms")
+
+# Inter-key intervals of human typists are roughly log-normal. The median is
+# derived from the 52 WPM average typing speed reported in Dhakal et al.,
+# "Observations on Typing from 136 Million Keystrokes" (CHI 2018), at
+# 5 characters per word. The spread is an assumed value, not fitted
+HUMAN_TYPING_WPM = 52
+HUMAN_TYPING_SIGMA = 0.35
+
+# Sets the value through the native setter so framework-controlled inputs
+# (React etc.) see the change, then fires the events they listen for
+SET_INPUT_VALUE_SCRIPT = """
+const element = arguments[0];
+const proto = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, arguments[1]);
+element.dispatchEvent(new Event('input', { bubbles: true }));
+element.dispatchEvent(new Event('change', { bubbles: true }));
+"""
+
+def human_typing_budget(text):
+    # Prompt entry used to cost 2 s of fixed sleeps plus 0.1 s per comma chunk
+    return 2 + 0.1 * len(text.split(","))
+
+def human_typing_schedule(text, wpm=HUMAN_TYPING_WPM, sigma=HUMAN_TYPING_SIGMA):
+    """Offsets in seconds at which each key is pressed, starting at 0"""
+    median = 60 / (wpm * 5)
+    intervals = [random.lognormvariate(math.log(median), sigma) for _ in text]
+    # Keep the modelled rhythm but never take longer than the old fixed sleeps
+    scale = min(1, human_typing_budget(text) / sum(intervals)) if intervals else 1
+    offsets = []
+    elapsed = 0
+    for interval in intervals:
+        offsets.append(elapsed)
+        elapsed += interval * scale
+    return offsets
+
 class LoginError(Exception):
     """Custom exception for login failures"""
     pass
@@ -60,13 +106,17 @@ download_dir = os.getcwd() + "/song_downloads/"
 
 
 class UdioMusicBot:
-    def __init__(self, headless: bool = False, max_retries: int = 5, stealth = True):
+    def __init__(self, headless: bool = False, max_retries: int = 5, stealth = True, input_mode: Optional[str] = None):
         self.logs_dir = Path("logs")
         self.logs_dir.mkdir(exist_ok=True)
         
         self.headless = headless
         self.stealth = stealth
         self.max_retries = max_retries
+        # Stealth sessions type like a person by default; others fill fields instantly
+        self.input_mode = input_mode or ("human" if stealth else "instant")
+        if self.input_mode not in INPUT_MODES:
+            raise ValueError(f"Unknown input mode: {self.input_mode}")
         
         # Get credentials from environment
         self.email = os.getenv("GOOGLE_EMAIL", "").strip()
@@ -311,7 +361,7 @@ class UdioMusicBot:
 
 
 
-    def create_song(self):
+    def create_song(self, prompt: Optional[str] = None):
         # once successfully logged in...
         # TODO: navigate to home if needed 
         
@@ -330,12 +380,10 @@ class UdioMusicBot:
                 else:
                     raise Exception("Prompt field not found")
 
-                prompt_field.clear()
-                time.sleep(1)
-                prompt = generate_prompt()
+                prompt = prompt or generate_prompt()
                 logger.info(f"Prompt: {prompt}")
-                self.slow_type(prompt_field,prompt)
-                time.sleep(1)
+                with phase_timer(f"prompt entry ({self.input_mode})"):
+                    self.enter_text(prompt_field, prompt)
 
                 self.wait_and_click("//button[contains(text(), 'Create')]", "Create song button")
                                
@@ -426,12 +474,23 @@ class UdioMusicBot:
                 logger.error(f"Download song error {str(e)}; attempt {retry_count + 1}/{self.max_retries}")
         retry_count+=1
 
-    def slow_type(self, element, text, delay = 0.1):
-        words = text.split(",")
-        for (i,word) in enumerate(words):
-            word_to_send = word + ", " if i < len(words) -1 else word
-            element.send_keys(word_to_send)
-            time.sleep(delay)
+    def enter_text(self, element, text):
+        if self.input_mode == "instant":
+            self.driver.execute_script(SET_INPUT_VALUE_SCRIPT, element, text)
+        else:
+            self.human_type(element, text)
+
+    def human_type(self, element, text):
+        element.clear()
+        text = text.replace(",", ", ")
+        start = time.perf_counter()
+        for char, offset in zip(text, human_typing_schedule(text)):
+            # Sleeping to an absolute deadline counts the send_keys round trip
+            # towards the modelled interval
+            remaining = start + offset - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            element.send_keys(char)
 
     def restart_session(self):
         try:
@@ -450,13 +509,14 @@ class UdioMusicBot:
                 logger.error(f"Error closing WebDriver: {str(e)}")
 
 if __name__ == "__main__":
+    args = parser.parse_args()
     stealth_bot = None
     reg_bot = None
     start_time = time.time()
     out = None
     
     try:
-        stealth_bot = UdioMusicBot(headless=bool(args.headless))
+        stealth_bot = UdioMusicBot(headless=bool(args.headless), input_mode=args.input_mode)
         if stealth_bot.login():
             logger.info("Login successful")
         else:
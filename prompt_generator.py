@@ -1,5 +1,13 @@
 
+import json
 import random
+import string
+import itertools
+from math import gcd
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 def generate_prompt():
     word_array = []
@@ -17,6 +25,122 @@ def generate_prompt():
         new_word = word_array.pop(random.randint(0, len(word_array) - 1))
         prompt = f"{prompt},{new_word}"
     return base_prompt + prompt
+
+
+class CompiledTemplate:
+    """A prompt template with its slots resolved to ordered value lists"""
+
+    def __init__(self, name: str, template: str, variations: Dict[str, List[str]]):
+        self.name = name
+        self.template = template
+        # Slot order follows first appearance in the template string
+        self.slots = []
+        for _, field, _, _ in string.Formatter().parse(template):
+            if field is None:
+                continue
+            if not field.isidentifier():
+                raise ValueError(f"Template '{name}' has a positional or unnamed field: {{{field}}}")
+            if field not in self.slots:
+                self.slots.append(field)
+        missing = [slot for slot in self.slots if not variations.get(slot)]
+        if missing:
+            raise ValueError(f"Template '{name}' has no variations for: {', '.join(missing)}")
+        self.values = [list(variations[slot]) for slot in self.slots]
+        self.size = 1
+        for values in self.values:
+            self.size *= len(values)
+
+    def render(self, combination) -> str:
+        return self.template.format(**dict(zip(self.slots, combination)))
+
+    def combination_at(self, index: int):
+        # Decode a mixed-radix index so any combination can be reached without
+        # materializing the product
+        combination = []
+        for values in reversed(self.values):
+            index, offset = divmod(index, len(values))
+            combination.append(values[offset])
+        return tuple(reversed(combination))
+
+    def expand(self) -> Iterator[str]:
+        for combination in itertools.product(*self.values):
+            yield self.render(combination)
+
+    def sample_stratified(self, count: int, rng: random.Random) -> Iterator[str]:
+        # Split the combination space into `count` equal strata and draw one
+        # index from each, so samples spread across the whole product
+        count = min(count, self.size)
+        for i in range(count):
+            start = i * self.size // count
+            end = (i + 1) * self.size // count
+            yield self.render(self.combination_at(rng.randrange(start, end)))
+
+    def sample_coverage(self, count: int, rng: random.Random) -> Iterator[str]:
+        # Every value of every slot appears within each block of
+        # len(largest slot) prompts, and no combination is ever repeated
+        if count >= self.size:
+            yield from self.expand()
+            return
+        # Digits are decoded largest slot first; each slot's value is its own
+        # digit shifted by the sum of the faster digits. This is a bijection
+        # on the index space, and within a block the fastest digit runs
+        # through every value of every slot
+        order = sorted(range(len(self.values)), key=lambda i: -len(self.values[i]))
+        shuffled = [rng.sample(values, len(values)) for values in self.values]
+        block_size = len(self.values[order[0]]) if order else 1
+        blocks = self.size // block_size
+        # Visit blocks in a seeded affine permutation of their order
+        step = rng.randrange(1, blocks) if blocks > 1 else 1
+        while gcd(step, blocks) != 1:
+            step = rng.randrange(1, blocks)
+        shift = rng.randrange(blocks)
+        for i in range(count):
+            block, offset = divmod(i, block_size)
+            index = ((step * block + shift) % blocks) * block_size + offset
+            combination = [None] * len(self.values)
+            total = 0
+            for slot in order:
+                index, digit = divmod(index, len(self.values[slot]))
+                total += digit
+                combination[slot] = shuffled[slot][total % len(self.values[slot])]
+            yield self.render(combination)
+
+
+class PromptGenerator:
+    """Loads and compiles every template in templates/ once, then streams prompts"""
+
+    SAMPLING_MODES = ("all", "stratified", "coverage")
+
+    def __init__(self, templates_dir: Path = TEMPLATES_DIR, seed: Optional[int] = None):
+        self.templates_dir = Path(templates_dir)
+        self.rng = random.Random(seed)
+        self.templates = {}
+        for path in sorted(self.templates_dir.glob("*.json")):
+            with open(path, "r") as file:
+                data = json.load(file)
+            name = data.get("name", path.stem)
+            self.templates[name] = CompiledTemplate(name, data["template"], data.get("variations", {}))
+
+    def get_template(self, template_name: str) -> CompiledTemplate:
+        if template_name not in self.templates:
+            available = ", ".join(sorted(self.templates)) or "none"
+            raise ValueError(f"Unknown template '{template_name}' (available: {available})")
+        return self.templates[template_name]
+
+    def iter_prompts(self, template_name: str, num_variations: Optional[int] = None, mode: str = "all") -> Iterator[str]:
+        """Lazily yield prompts; `num_variations=None` streams the whole product"""
+        template = self.get_template(template_name)
+        if mode not in self.SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode '{mode}'")
+        if mode == "all" or num_variations is None or num_variations >= template.size:
+            return itertools.islice(template.expand(), num_variations)
+        if mode == "stratified":
+            return template.sample_stratified(num_variations, self.rng)
+        return template.sample_coverage(num_variations, self.rng)
+
+    def get_prompt_variations(self, num_variations: int = 1, template_name: str = "synthwave", mode: str = "coverage") -> Iterator[str]:
+        return self.iter_prompts(template_name, num_variations, mode)
+
 if __name__ == "__main__":
     print("random prompt:")
     print(generate_prompt())
\ No newline at end of file